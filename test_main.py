@@ -0,0 +1,97 @@
+"""
+Regression Checks
+Run with: python -m unittest test_main
+"""
+
+import os
+import re
+import tempfile
+import unittest
+
+from main import (
+    MMAP_MIN_SIZE,
+    PATTERNS,
+    candidate_chunks,
+    collect_matches,
+    extract_data,
+    extract_file
+)
+
+
+def extract_whole_text(text):
+    """
+    Reference result: every pattern run over the whole text, no line filter.
+    """
+    matches = (
+        (kind, match)
+        for kind, pattern in PATTERNS.items()
+        for match in re.findall(pattern, text)
+    )
+    return collect_matches(matches)
+
+
+class CandidateChunksTest(unittest.TestCase):
+    """
+    candidate_chunks keeps the line after every kept line, which is only
+    safe while no match spans more than one line break.
+    """
+
+    def test_time_across_line_break(self):
+        text = "Meet at 11:45\nAM sharp\nplain words here\n"
+        results, rejected = extract_data(text)
+        self.assertIn('11:45\nAM', results['times'])
+        self.assertEqual((results, rejected), extract_whole_text(text))
+
+    def test_phone_across_line_break(self):
+        text = "Call 555\n123-4567 today\nplain words here\n"
+        results, rejected = extract_data(text)
+        self.assertIn('555\n123-4567', results['phones'])
+        self.assertEqual((results, rejected), extract_whole_text(text))
+
+    def test_skipped_lines_are_dropped(self):
+        text = "no sigils\nat 9:00\nstill none\nnor here\n"
+        self.assertEqual(list(candidate_chunks(text)), ["at 9:00\nstill none\n"])
+
+
+class ExtractFileTest(unittest.TestCase):
+    """
+    extract_file must give the same answers as extract_data on the
+    file's text, whichever path (mmap or str) it takes.
+    """
+
+    LINE = "Café#tag éjohn@example.com 12:30\xa0PM call 555-123-4567 #ok\n"
+
+    def write_file(self, content):
+        fd, path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w', newline='') as file:
+            file.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def assert_matches_extract_data(self, content):
+        path = self.write_file(content)
+        with open(path) as file:
+            expected = extract_data(file.read())
+        self.assertEqual(extract_file(path), expected)
+        return path
+
+    def test_non_ascii_file(self):
+        small = self.assert_matches_extract_data(self.LINE)
+        large = self.assert_matches_extract_data(self.LINE * 3000)
+        self.assertGreaterEqual(os.path.getsize(large), MMAP_MIN_SIZE)
+        self.assertEqual(extract_file(small)[0], extract_file(large)[0])
+
+    def test_crlf_file(self):
+        line = "Call 555\r\n123-4567 at 11:45\r\nAM or mail a@b.co\r\n"
+        path = self.assert_matches_extract_data(line * 3000)
+        self.assertGreaterEqual(os.path.getsize(path), MMAP_MIN_SIZE)
+
+    def test_large_ascii_file(self):
+        with open(os.path.join(os.path.dirname(__file__), 'input.txt')) as file:
+            text = file.read()
+        path = self.assert_matches_extract_data(text * 50)
+        self.assertGreaterEqual(os.path.getsize(path), MMAP_MIN_SIZE)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Validation Functions
+Checks that each extracted item looks real.
+
+Kept free of regex and fully annotated so the module can be compiled
+with mypyc (mypyc validators.py). main.py imports the compiled version
+automatically when it is present.
+"""
+
+# Lookup table for one- and two-digit numbers ("7", "07", "45" ...),
+# so the usual hour and minute strings don't need int() at all
+_TWO_DIGIT = {}
+for _n in range(100):
+    _TWO_DIGIT[str(_n)] = _n
+    _TWO_DIGIT[f'{_n:02d}'] = _n
+del _n
+
+
+def is_valid_email(email: str) -> bool:
+    """
+    Check if email looks reasonable.
+    Rules:
+    - Not too long (max 100 chars)
+    - Has exactly one @
+    - Domain has a dot
+    """
+    if len(email) > 100:
+        return False
+    # Split at the first @ and make sure there isn't a second one
+    _, at, domain = email.partition('@')
+    if not at or '@' in domain:
+        return False
+    # Domain must have a dot
+    return '.' in domain
+
+
+def is_valid_url(url: str) -> bool:
+    """
+    Check if URL looks reasonable.
+    Rules:
+    - Not too long (max 200 chars)
+    - Starts with http:// or https://
+    """
+    if len(url) > 200:
+        return False
+    if not url.startswith(('http://', 'https://')):
+        return False
+    return True
+
+
+def is_valid_phone(phone: str) -> bool:
+    """
+    Check if phone number has correct length.
+    Rules:
+    - Must have exactly 10 digits (US format)
+    """
+    # Count digits the same way \d does (isdecimal, not isdigit)
+    digits = sum(map(str.isdecimal, phone))
+    # US phone numbers have 10 digits
+    return digits == 10
+
+
+def is_valid_time(time_str: str) -> bool:
+    """
+    Check if time makes sense.
+    Rules:
+    - Hours: 0-23 (24-hour) or 1-12 (12-hour with AM/PM)
+    - Minutes: 0-59
+    """
+    # Remove spaces and convert to uppercase for easier checking
+    time_clean = time_str.replace(' ', '').upper()
+    twelve_hour = 'AM' in time_clean or 'PM' in time_clean
+    
+    # Split by colon (there must be exactly one)
+    hours_str, colon, minutes_str = time_clean.partition(':')
+    if not colon or ':' in minutes_str:
+        return False
+    
+    # Minutes might have AM/PM attached
+    if twelve_hour:
+        minutes_str = minutes_str.replace('AM', '').replace('PM', '')
+    
+    hours = _TWO_DIGIT.get(hours_str)
+    minutes = _TWO_DIGIT.get(minutes_str)
+    if hours is None or minutes is None:
+        # Anything unusual goes through int() like before
+        try:
+            hours = int(hours_str)
+            minutes = int(minutes_str)
+        except ValueError:
+            return False
+    
+    # Check minutes (always 0-59)
+    if minutes < 0 or minutes > 59:
+        return False
+    
+    # Check hours
+    if twelve_hour:
+        # 12-hour format: 1-12
+        if hours < 1 or hours > 12:
+            return False
+    else:
+        # 24-hour format: 0-23
+        if hours < 0 or hours > 23:
+            return False
+    
+    return True
+
+
+def is_valid_hashtag(hashtag: str) -> bool:
+    """
+    Check if hashtag is reasonable.
+    Rules:
+    - Length: 2-50 characters (including #)
+    - Not all numbers
+    """
+    if len(hashtag) < 2 or len(hashtag) > 50:
+        return False
+    # Remove # and check content
+    content = hashtag[1:]
+    # Can't be all digits
+    if content.isdigit():
+        return False
+    return True
\ No newline at end of file